@@ -29,8 +29,11 @@ REM ---- Step 5: data preprocessing ----
 echo data preprocessing is not needed. skipping preprocessing...
 REM -- python src\preprocessing\data_loader.py
 
+REM ---- Step 6: compile ready-to-serve snapshot (only when stale) ----
+python -m src.analysis.snapshot data\books.csv --if-stale
 
-REM ---- Step 4: run Streamlit ----
+
+REM ---- Step 7: run Streamlit ----
 echo Starting Streamlit app...
 streamlit run src/app.py
 
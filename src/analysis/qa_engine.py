@@ -1,19 +1,37 @@
-import pandas as pd
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .snapshot import (
+    build_search_index,
+    category_aggregates,
+    category_order,
+    load_snapshot,
+    search_index,
+)
 
-from .categorical import CategoricalAnalysis
-from .numerical import NumericalAnalysis
-from .hybrid import HybridAnalysis
+if TYPE_CHECKING:
+    import pandas as pd
 
 class QuestionAnswerer:
     """Unified Q&A Engine that maps questions to analysis functions."""
 
-    def __init__(self, data_path: str | Path = "data/books.csv"):
+    def __init__(self, data_path: str | Path = "data/books.csv", use_snapshot: bool = True):
         self.data_path = Path(data_path)
+        self._df = None
+
+        # Serve from a fresh precompiled bundle when there is one
+        self.snapshot = load_snapshot(self.data_path) if use_snapshot else None
+        if self.snapshot is not None:
+            self.questions = self.snapshot.questions()
+            return
 
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
         
+        import pandas as pd
+
         if self.data_path.suffix == ".csv":
             self.df = pd.read_csv(self.data_path)
         elif self.data_path.suffix == ".json":
@@ -26,14 +44,59 @@ class QuestionAnswerer:
         # Map questions to functions
         self.question_mapping()
     
+    @property
+    def df(self) -> pd.DataFrame:
+        # Snapshot rows are only memory-mapped once something needs them
+        if self._df is None and self.snapshot is not None:
+            self._df = self.snapshot.dataframe()
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        self._df = value
+
     def get_dataframe(self) -> pd.DataFrame:
         """Return the loaded dataframe."""
         return self.df
     
     def get_questions(self):
         return [{"id": qid, "description": desc} for qid, (desc, _) in self.questions.items()]
+
+    def get_categories(self) -> list[str]:
+        """Return the categories present in the dataset."""
+        if self.snapshot is not None:
+            return self.snapshot.categories
+        return category_order(self.df)
+
+    def get_category_stats(self, category: str) -> dict | None:
+        """Return precomputed aggregates for a category."""
+        if self.snapshot is not None:
+            aggregates = self.snapshot.aggregates
+        else:
+            aggregates = category_aggregates(self.df)
+        return aggregates.get(category)
+
+    def search_titles(self, query: str, limit: int | None = None,
+                      columns: list[str] | None = None) -> pd.DataFrame:
+        """Return books whose title contains the query (case-insensitive)."""
+        if self.snapshot is not None:
+            positions = search_index(self.snapshot.search_index, query, limit)
+            return self.snapshot.rows(positions, columns)
+        matches = self.df.iloc[search_index(build_search_index(self.df), query, limit)]
+        return matches[columns] if columns else matches
+
+    def get_category_books(self, category: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """Return the books listed under a category."""
+        if self.snapshot is not None:
+            return self.snapshot.category_rows(category, columns)
+        books = self.df[self.df["category"] == category]
+        return books[columns] if columns else books
         
     def _initialize_analysis_modules(self):
+        from .categorical import CategoricalAnalysis
+        from .numerical import NumericalAnalysis
+        from .hybrid import HybridAnalysis
+
         self.categorical = CategoricalAnalysis(self.data_path)
         self.numerical = NumericalAnalysis(self.data_path)
         self.hybrid = HybridAnalysis(self.data_path)
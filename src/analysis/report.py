@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .qa_engine import QuestionAnswerer
+from .snapshot import SNAPSHOT_SUFFIX, json_default
+
+DEFAULT_GLOB = "*.csv"
+# Files that live next to the datasets but are not datasets themselves
+NON_DATASET_FILES = ("page_cache.json",)
+
+
+def expand_datasets(paths: list[str | Path], pattern: str = DEFAULT_GLOB,
+                    exclude: list[str | Path] | None = None) -> list[Path]:
+    """Expand directories into the dataset files matching ``pattern``."""
+    excluded = {Path(p).resolve() for p in exclude or []}
+    datasets = []
+    for path in map(Path, paths):
+        if path.is_dir() and path.suffix == SNAPSHOT_SUFFIX:
+            # Compiled bundles hold precomputed answers, not a dataset to evaluate
+            print(f"Skipping compiled snapshot bundle {path}; pass its source dataset instead.",
+                  file=sys.stderr)
+        elif path.is_dir():
+            datasets.extend(
+                sorted(p for p in path.glob(pattern)
+                       if p.is_file()
+                       and p.name not in NON_DATASET_FILES
+                       and p.resolve() not in excluded)
+            )
+        else:
+            datasets.append(path)
+    return datasets
+
+
+def evaluate_dataset(data_path: str | Path) -> dict:
+    """Answer every registered question for one dataset, timing each answer."""
+    data_path = Path(data_path)
+    report = {"dataset": str(data_path), "status": "ok", "error": None,
+              "failed": 0, "results": []}
+
+    start = time.perf_counter()
+    try:
+        # Always evaluate from the source so timings measure the questions themselves
+        qa = QuestionAnswerer(data_path, use_snapshot=False)
+    except Exception as exc:  # one unreadable dataset must not sink the batch
+        report["status"] = "failed"
+        report["error"] = f"{type(exc).__name__}: {exc}"
+        return report
+    report["load_seconds"] = round(time.perf_counter() - start, 6)
+    report["books"] = len(qa.get_dataframe())
+
+    for qid in qa.questions:
+        start = time.perf_counter()
+        error = None
+        try:
+            res = qa.answer_question(qid)
+        except Exception as exc:  # one broken question must not sink the report
+            error = f"{type(exc).__name__}: {exc}"
+            res = {"question": qa.questions[qid][0], "answer": None,
+                   "justification": f"Error: {error}"}
+            report["failed"] += 1
+        report["results"].append({
+            "id": qid,
+            "question": res["question"],
+            "answer": res["answer"],
+            "justification": res["justification"],
+            "error": error,
+            "seconds": round(time.perf_counter() - start, 6),
+        })
+
+    # A dataset where every question failed is broken, not merely incomplete
+    if report["failed"]:
+        total = len(report["results"])
+        report["status"] = "failed" if report["failed"] == total else "partial"
+        report["error"] = f"{report['failed']}/{total} questions failed"
+
+    return report
+
+
+def build_report(paths: list[str | Path], workers: int | None = None,
+                 pattern: str = DEFAULT_GLOB,
+                 exclude: list[str | Path] | None = None) -> dict:
+    """Evaluate all datasets, spreading them across a process pool."""
+    datasets = expand_datasets(paths, pattern, exclude)
+    start = time.perf_counter()
+
+    used_workers = min(workers or os.cpu_count() or 1, len(datasets))
+    if used_workers <= 1:
+        used_workers = 1 if datasets else 0
+        reports = [evaluate_dataset(p) for p in datasets]
+    else:
+        with ProcessPoolExecutor(max_workers=used_workers) as pool:
+            reports = list(pool.map(evaluate_dataset, datasets))
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "workers": used_workers,
+        "total_seconds": round(time.perf_counter() - start, 6),
+        "failed_datasets": sum(r["status"] != "ok" for r in reports),
+        "datasets": reports,
+    }
+
+
+def report_to_rows(report: dict) -> list[dict]:
+    """Flatten a report into one row per (dataset, question)."""
+    rows = []
+    for ds in report["datasets"]:
+        dataset = {
+            "dataset": ds["dataset"],
+            "dataset_status": ds["status"],
+            "dataset_error": ds["error"],
+            "load_seconds": ds.get("load_seconds"),
+            "books": ds.get("books"),
+        }
+        if not ds["results"]:
+            # Keep datasets that failed to load visible in the flat report
+            rows.append({**dataset, "id": None, "question": None, "answer": None,
+                         "justification": None, "error": ds["error"], "seconds": None})
+            continue
+        for res in ds["results"]:
+            rows.append({
+                **dataset,
+                "id": res["id"],
+                "question": res["question"],
+                "answer": json.dumps(res["answer"], default=json_default, ensure_ascii=False),
+                "justification": res["justification"],
+                "error": res["error"],
+                "seconds": res["seconds"],
+            })
+    return rows
+
+
+def save_report(report: dict, output: str | Path):
+    """Write the report as JSON, or as Parquet when the path ends in .parquet."""
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    if output.suffix == ".parquet":
+        import pandas as pd
+
+        pd.DataFrame(report_to_rows(report)).to_parquet(output, index=False)
+    else:
+        output.write_text(
+            json.dumps(report, indent=2, ensure_ascii=False, default=json_default),
+            encoding="utf-8",
+        )
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Evaluate every Q&A question across one or more dataset snapshots."
+    )
+    parser.add_argument("datasets", nargs="*", default=["data/books.csv"],
+                        help="CSV/JSON files or directories of snapshots")
+    parser.add_argument("-g", "--glob", default=DEFAULT_GLOB,
+                        help=f"Pattern for dataset files inside directories (default: {DEFAULT_GLOB})")
+    parser.add_argument("-o", "--output",
+                        help="Report path (.json or .parquet); prints JSON to stdout if omitted")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.datasets, workers=args.workers, pattern=args.glob,
+                          exclude=[args.output] if args.output else None)
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"✅ Report for {len(report['datasets'])} dataset(s) saved to {args.output}")
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False, default=json_default))
+
+    if report["failed_datasets"]:
+        print(f"⚠️  {report['failed_datasets']} dataset(s) failed or were incomplete", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Precompiled, ready-to-serve dataset snapshots.
+
+A snapshot is a directory next to the source dataset (``data/books.csv`` →
+``data/books.csv.snapshot/``) holding everything needed to answer questions
+without re-reading the CSV:
+
+- ``manifest.json``      version, source file stamp, code fingerprint, question ids
+                         and categories
+- ``books.feather``      the dataset, uncompressed and memory-mapped on read; only
+                         the rows/columns a caller asks for are turned into pandas
+- ``answers.json``       every question answer, precomputed
+- ``aggregates.json``    per-category aggregates
+- ``search_index.json``  lower-cased titles in row order
+
+A bundle is only served while its source file and the analysis code are
+unchanged; bump ``SNAPSHOT_VERSION`` when the bundle layout itself changes.
+Only the stdlib is imported at module level; pandas/pyarrow are loaded on demand.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from functools import cached_property
+from pathlib import Path
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+# Modules whose logic ends up in answers.json / aggregates.json
+ANALYSIS_MODULES = ("categorical.py", "numerical.py", "hybrid.py", "qa_engine.py", "snapshot.py")
+
+
+def json_default(value):
+    """Convert numpy/pandas scalars (and anything else) to JSON-friendly values."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def snapshot_path(data_path: str | Path) -> Path:
+    """Return the bundle directory used for a dataset file."""
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.name + SNAPSHOT_SUFFIX)
+
+
+def code_fingerprint() -> str:
+    """Hash of the analysis sources, so changed question logic invalidates bundles."""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).parent
+    for name in ANALYSIS_MODULES:
+        digest.update(name.encode())
+        digest.update((package_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def source_stamp(data_path: str | Path) -> dict:
+    """Cheap fingerprint of the source file used to detect stale bundles."""
+    stat = Path(data_path).stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def category_order(df) -> list[str]:
+    """Categories in the order they first appear in the dataset."""
+    return list(dict.fromkeys(df["category"].dropna().tolist()))
+
+
+def category_aggregates(df) -> dict:
+    """Per-category aggregates served by the app without touching the rows."""
+    aggregates = {}
+    for cat in category_order(df):
+        group = df[df["category"] == cat]
+        in_stock = group[group["availability"] == "In stock"]
+        aggregates[cat] = {
+            "books": int(len(group)),
+            "avg_price": round(float(group["price"].mean()), 2),
+            "min_price": round(float(group["price"].min()), 2),
+            "max_price": round(float(group["price"].max()), 2),
+            "in_stock": int(len(in_stock)),
+            "out_of_stock_pct": round((len(group) - len(in_stock)) / len(group) * 100, 1),
+            "total_stock": int(group["stock_count"].sum()),
+            "avg_desc_words": round(float(
+                group["description"].fillna("").apply(lambda d: len(d.split())).mean()
+            ), 2),
+        }
+    return aggregates
+
+
+def build_search_index(df) -> list[str]:
+    """Lower-cased titles, one per row, for substring search."""
+    return df["title"].fillna("").astype(str).str.lower().tolist()
+
+
+def search_index(index: list[str], query: str, limit: int | None = None) -> list[int]:
+    """Return row positions whose title contains ``query`` (case-insensitive)."""
+    needle = query.lower()
+    hits = [i for i, title in enumerate(index) if needle in title]
+    return hits[:limit] if limit is not None else hits
+
+
+def _write_json(path: Path, payload, default=None):
+    path.write_text(json.dumps(payload, ensure_ascii=False, default=default), encoding="utf-8")
+
+
+def compile_snapshot(data_path: str | Path = "data/books.csv") -> Path:
+    """Load the dataset once, precompute everything and write a snapshot bundle."""
+    import pyarrow.feather as feather
+
+    from .qa_engine import QuestionAnswerer
+
+    data_path = Path(data_path)
+    # Stamp before reading so a rewrite during compilation cannot look fresh
+    stamp = source_stamp(data_path)
+    qa = QuestionAnswerer(data_path, use_snapshot=False)
+    df = qa.get_dataframe()
+
+    answers = {qid: qa.answer_question(qid) for qid in qa.questions}
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "source": data_path.name,
+        "source_stamp": stamp,
+        "code": code_fingerprint(),
+        "books": int(len(df)),
+        "questions": [{"id": q["id"], "description": q["description"]} for q in qa.get_questions()],
+        "categories": category_order(df),
+    }
+
+    bundle = snapshot_path(data_path)
+    tmp = bundle.with_name(bundle.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    feather.write_feather(df.reset_index(drop=True), tmp / "books.feather", compression="uncompressed")
+    _write_json(tmp / "answers.json", answers, default=json_default)
+    _write_json(tmp / "aggregates.json", category_aggregates(df))
+    _write_json(tmp / "search_index.json", build_search_index(df))
+
+    if source_stamp(data_path) != stamp:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise RuntimeError(f"{data_path} changed while compiling its snapshot; run again.")
+    # Manifest last: a bundle without one is never considered valid
+    _write_json(tmp / "manifest.json", manifest)
+
+    # Move the old bundle aside before swapping, so a failure never leaves a half-deleted one
+    old = bundle.with_name(bundle.name + ".old")
+    if old.exists():
+        shutil.rmtree(old)
+    if bundle.exists():
+        os.replace(bundle, old)
+    os.replace(tmp, bundle)
+    try:
+        shutil.rmtree(old)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:  # e.g. a running app still has the old files open on Windows
+        print(f"⚠️  Could not remove previous snapshot {old}: {exc}")
+    return bundle
+
+
+class Snapshot:
+    """Read-only view over a compiled snapshot bundle."""
+
+    def __init__(self, bundle_dir: str | Path, manifest: dict):
+        self.bundle_dir = Path(bundle_dir)
+        self.manifest = manifest
+
+    def _read_json(self, name: str):
+        return json.loads((self.bundle_dir / name).read_text(encoding="utf-8"))
+
+    @cached_property
+    def answers(self) -> dict:
+        return self._read_json("answers.json")
+
+    @cached_property
+    def aggregates(self) -> dict:
+        return self._read_json("aggregates.json")
+
+    @cached_property
+    def search_index(self) -> list[str]:
+        return self._read_json("search_index.json")
+
+    @property
+    def categories(self) -> list[str]:
+        return self.manifest["categories"]
+
+    def questions(self) -> dict:
+        """Question mapping in the same shape as ``QuestionAnswerer.questions``."""
+        return {
+            q["id"]: (q["description"], lambda qid=q["id"]: self.answers[qid])
+            for q in self.manifest["questions"]
+        }
+
+    @cached_property
+    def table(self):
+        """Memory-mapped Arrow table; nothing is copied until columns are converted."""
+        import pyarrow.feather as feather
+
+        return feather.read_table(self.bundle_dir / "books.feather", memory_map=True)
+
+    def dataframe(self, columns: list[str] | None = None):
+        """Return the dataset (or just ``columns``) as a DataFrame."""
+        table = self.table.select(columns) if columns else self.table
+        return table.to_pandas()
+
+    def rows(self, positions: list[int], columns: list[str] | None = None):
+        """Return only the given row positions as a DataFrame."""
+        table = self.table.take(positions)
+        return (table.select(columns) if columns else table).to_pandas()
+
+    def category_rows(self, category: str, columns: list[str] | None = None):
+        """Return the books of one category as a DataFrame."""
+        import pyarrow.compute as pc
+
+        table = self.table.filter(pc.equal(self.table["category"], category))
+        return (table.select(columns) if columns else table).to_pandas()
+
+
+def load_snapshot(data_path: str | Path) -> Snapshot | None:
+    """Open the bundle for ``data_path`` if it exists and is fresh, else None."""
+    data_path = Path(data_path)
+    bundle = snapshot_path(data_path)
+    try:
+        manifest = json.loads((bundle / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        return None
+    if manifest.get("source") != data_path.name:
+        return None
+    if manifest.get("code") != code_fingerprint():
+        return None
+    # Without the source we cannot tell it is stale, so serve what we have
+    if data_path.exists() and manifest.get("source_stamp") != source_stamp(data_path):
+        return None
+    return Snapshot(bundle, manifest)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a ready-to-serve dataset snapshot.")
+    parser.add_argument("data_path", nargs="?", default="data/books.csv")
+    parser.add_argument("--if-stale", action="store_true",
+                        help="Only compile when there is no fresh bundle")
+    args = parser.parse_args()
+
+    if args.if_stale and load_snapshot(args.data_path) is not None:
+        print(f"✅ Snapshot for {args.data_path} is up to date")
+        raise SystemExit(0)
+
+    bundle = compile_snapshot(args.data_path)
+    print(f"✅ Snapshot compiled to {bundle}")
@@ -1,6 +1,22 @@
+from pathlib import Path
+
 import streamlit as st
 
 from analysis.qa_engine import QuestionAnswerer
+from analysis.snapshot import snapshot_path
+
+DATA_PATH = Path("data/books.csv")
+DISPLAY_COLUMNS = ["title", "category", "price", "availability", "stock_count"]
+
+def engine_stamp() -> tuple:
+    """Modification times of the dataset and its snapshot manifest."""
+    paths = (DATA_PATH, snapshot_path(DATA_PATH) / "manifest.json")
+    return tuple(p.stat().st_mtime_ns if p.exists() else None for p in paths)
+
+@st.cache_resource(max_entries=1)
+def load_engine(stamp: tuple) -> QuestionAnswerer:
+    """Build the engine once per dataset/snapshot version, not on every rerun."""
+    return QuestionAnswerer(DATA_PATH)
 
 def main():
     st.set_page_config(page_title="Book Q&A Engine", layout="centered")
@@ -8,9 +24,8 @@ def main():
     st.title("📚 Book Q&A Engine")
     st.write("Ask predefined questions about the dataset scraped from Books to Scrape.")
 
-    # Initialize engine
-    qa = QuestionAnswerer()
-    df = qa.get_dataframe()
+    # Initialize engine (opens the precompiled snapshot when one is fresh)
+    qa = load_engine(engine_stamp())
 
     # Dropdown for questions
     questions = qa.get_questions()
@@ -37,18 +52,17 @@ def main():
     query = st.text_input("Search for books by title:")
 
     if query:
-        df = qa.df  # access raw dataframe
-        matches = df[df["title"].str.contains(query, case=False, na=False)]
+        matches = qa.search_titles(query, limit=10, columns=DISPLAY_COLUMNS)
         if matches.empty:
             st.warning("No books found.")
         else:
-            st.write(matches[["title", "category", "price", "availability", "stock_count"]].head(10))
+            st.write(matches)
 
     st.write("---")
     st.subheader("Filter Books by category")
     # Create bubbles/buttons for each category
     cols = st.columns(4)
-    categories = ["travel", "mystery", "historical-fiction", "classics"]
+    categories = qa.get_categories()
 
     selected_category = None
     for i, category in enumerate(categories):
@@ -60,27 +74,27 @@ def main():
     # Display books for selected category
     if selected_category:
         st.write(f"### Books in '{selected_category}' category")
-        category_books = df[df['category'] == selected_category]
+        category_books = qa.get_category_books(selected_category, columns=DISPLAY_COLUMNS)
         
         if category_books.empty:
             st.warning(f"No books found in the '{selected_category}' category.")
         else:
             st.write(f"Found {len(category_books)} book(s) in this category:")
             st.dataframe(
-                category_books[["title", "category", "price", "availability", "stock_count"]],
+                category_books,
                 height=400,
                 use_container_width=True
             )
             
             # Show some quick stats
+            stats = qa.get_category_stats(selected_category)
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Average Price", f"£{category_books['price'].mean():.2f}")
+                st.metric("Average Price", f"£{stats['avg_price']:.2f}")
             with col2:
-                in_stock = category_books[category_books['availability'] == 'In stock']
-                st.metric("Books In Stock", len(in_stock))
+                st.metric("Books In Stock", stats["in_stock"])
             with col3:
-                st.metric("Total Stock Count", category_books['stock_count'].sum())
+                st.metric("Total Stock Count", stats["total_stock"])
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
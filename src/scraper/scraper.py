@@ -1,6 +1,6 @@
 import pandas as pd
 
-from utils import scrape_category
+from utils import PageCache, scrape_category
 
 BASE_URL = "https://books.toscrape.com/catalogue/category/books/"
 CATEGORIES = {
@@ -9,20 +9,31 @@ CATEGORIES = {
     "historical-fiction": "historical-fiction_4/index.html",
     "classics": "classics_6/index.html",
 }
+PAGE_CACHE_PATH = "data/page_cache.json"
 
-def scrape_all_categories(categories: dict, base_url: str) -> pd.DataFrame:
+def scrape_all_categories(categories: dict, base_url: str,
+                          cache: PageCache | None = None) -> pd.DataFrame:
     """Scrape all defined categories and return DataFrame."""
+    cache = cache if cache is not None else PageCache()
     all_books = []
     for cat, url in categories.items():
-        books = scrape_category(cat, url, base_url)
+        books = scrape_category(cat, url, base_url, cache)
         all_books.extend(books)
 
-    return pd.DataFrame(all_books)
+    df = pd.DataFrame(all_books)
+    if not df.empty:
+        # Every category a book was listed under, e.g. "travel|classics"
+        df["categories"] = df["url"].map(lambda u: "|".join(cache.memberships[u]))
+    return df
 
 def scrape_books_main():
     """Scrape all books from all categories."""
-    df = scrape_all_categories(CATEGORIES, BASE_URL)
+    cache = PageCache(PAGE_CACHE_PATH)
+    df = scrape_all_categories(CATEGORIES, BASE_URL, cache)
+    cache.save()
     print(f"Scraped {len(df)} books.")
+    print("Fetches: {fetches} (avoided {fetches_avoided}), "
+          "parses: {parses} (avoided {parses_avoided})".format(**cache.stats))
 
     # Save outputs
     df.to_csv("data/books.csv", index=False)
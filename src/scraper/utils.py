@@ -1,10 +1,62 @@
 import re
+import json
 import time
+import hashlib
 import requests
-import pandas as pd
+from pathlib import Path
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+# Bump whenever parse_listing/parse_book_detail change so cached records are re-extracted
+PARSER_VERSION = 1
+
+
+class PageCache:
+    """Content-hash cache of extracted page records with fetch/parse stats."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self.records = {}      # "<parser>:<sha256 of body>" -> extracted record
+        self.books = {}        # book url -> detail record fetched during this crawl
+        self.memberships = {}  # book url -> categories it was listed under
+        self.used = set()      # record keys hit or added during this crawl
+        self.stats = {"fetches": 0, "fetches_avoided": 0, "parses": 0, "parses_avoided": 0}
+
+        if self.path and self.path.exists():
+            try:
+                stored = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                stored = {}
+            # Records extracted by other parser versions are dropped wholesale
+            if isinstance(stored, dict) and stored.get("parser_version") == PARSER_VERSION:
+                self.records = stored.get("records", {})
+
+    def save(self):
+        """Persist the records seen in this crawl so later crawls can skip parsing."""
+        if self.path:
+            records = {k: v for k, v in self.records.items() if k in self.used}
+            payload = {"parser_version": PARSER_VERSION, "records": records}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+def fetch_record(url: str, parser, cache: PageCache) -> dict:
+    """Fetch a page and return its extracted record, parsing only unseen bodies."""
+    response = requests.get(url)
+    response.raise_for_status()
+    cache.stats["fetches"] += 1
+
+    key = f"{parser.__name__}:{hashlib.sha256(response.content).hexdigest()}"
+    cache.used.add(key)
+    if key in cache.records:
+        cache.stats["parses_avoided"] += 1
+        return cache.records[key]
+
+    record = parser(response.text)
+    cache.stats["parses"] += 1
+    cache.records[key] = record
+    return record
+
 
 def get_rating(star_class: str) -> int:
     """Convert star rating class to integer."""
@@ -20,73 +72,86 @@ def get_rating(star_class: str) -> int:
             return v
     return None
 
-def scrape_category(category_name: str, category_url: str, base_url: str) -> list[dict]:
+def parse_listing(html: str) -> dict:
+    """Extract the book summaries and the "next" link from a listing page."""
+    soup = BeautifulSoup(html, "html.parser")
+    articles = soup.select("article.product_pod")
+
+    books = []
+    for article in articles:
+        title = article.h3.a["title"] # Get title
+
+        # Get price
+        price_text = article.select_one(".price_color").text.strip()
+        clean_price = re.sub(r"[^0-9.]", "", price_text)
+        price = float(clean_price.replace("£", ""))
+
+        # Get availability
+        availability_text = article.select_one(".availability").text.strip()
+        availability = (
+            "In stock" if "In stock" in availability_text else "Out of stock"
+        )
+
+        # Get rating
+        rating = get_rating(article.get("class", [])) or get_rating(
+            article.select_one("p.star-rating")["class"]
+        )
+
+        books.append(
+            {
+                "title": title,
+                "price": price,
+                "availability": availability,
+                "rating": rating,
+                "href": article.h3.a["href"],
+            }
+        )
+
+    # Check for "next" page
+    next_button = soup.select_one("li.next > a")
+    return {"books": books, "next": next_button["href"] if next_button else None}
+
+def scrape_category(category_name: str, category_url: str, base_url: str,
+                    cache: PageCache | None = None) -> list[dict]:
     """Scrape all books from a given category."""
+    cache = cache if cache is not None else PageCache()
     books = []
     url = urljoin(base_url, category_url)
 
     while url:
         print(f"Scraping: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        articles = soup.select("article.product_pod")
-
-        for article in articles:
-            title = article.h3.a["title"] # Get title
-
-            # Get price
-            price_text = article.select_one(".price_color").text.strip()
-            clean_price = re.sub(r"[^0-9.]", "", price_text)
-            price = float(clean_price.replace("£", ""))
-
-            # Get availability
-            availability_text = article.select_one(".availability").text.strip()
-            availability = (
-                "In stock" if "In stock" in availability_text else "Out of stock"
-            )
-
-            # Get rating
-            rating = get_rating(article.get("class", [])) or get_rating(
-                article.select_one("p.star-rating")["class"]
-            )
+        listing = fetch_record(url, parse_listing, cache)
 
+        for item in listing["books"]:
             # Follow link to get description and stock count
-            book_url = urljoin(url, article.h3.a["href"])
-            description, availability_raw, stock_count = scrape_book_detail(book_url)
+            book_url = urljoin(url, item["href"])
+            description, availability_raw, stock_count = scrape_book_detail(book_url, cache)
+            cache.memberships.setdefault(book_url, [])
+            if category_name not in cache.memberships[book_url]:
+                cache.memberships[book_url].append(category_name)
 
             books.append(
                 {
-                    "title": title,
+                    "title": item["title"],
                     "category": category_name,
-                    "price": price,
-                    "availability": availability,
+                    "price": item["price"],
+                    "availability": item["availability"],
                     "stock_count": stock_count, 
-                    "rating": rating,
+                    "rating": item["rating"],
                     "description": description,
                     "url": book_url,
                 }
             )
 
-        # Check for "next" page
-        next_button = soup.select_one("li.next > a")
-        if next_button:
-            next_href = next_button["href"]
-            url = urljoin(url, next_href)
-        else:
-            url = None
+        url = urljoin(url, listing["next"]) if listing["next"] else None
 
         time.sleep(1)
 
     return books
 
-def scrape_book_detail(book_url: str) -> tuple[str, int, str]:
-    """Scrape description and availability (with numeric count) from detail page."""
-    response = requests.get(book_url)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_book_detail(html: str) -> dict:
+    """Extract description and availability (with numeric count) from a detail page."""
+    soup = BeautifulSoup(html, "html.parser")
 
     # Description
     desc_elem = soup.select_one("#product_description ~ p")
@@ -107,16 +172,28 @@ def scrape_book_detail(book_url: str) -> tuple[str, int, str]:
             stock_count = int(match.group(1)) if match else 0
             break
 
-    return description, availability_raw, stock_count
+    return {
+        "description": description,
+        "availability_raw": availability_raw,
+        "stock_count": stock_count,
+    }
 
-# Getting just description (Updated with the function above 'scrape_book_detail')
-def scrape_book_description(book_url: str) -> str:
-    """Scrape the book description from detail page."""
-    response = requests.get(book_url)
-    response.raise_for_status()
+def scrape_book_detail(book_url: str, cache: PageCache | None = None) -> tuple[str, str, int]:
+    """Scrape description and availability (with numeric count) from detail page."""
+    cache = cache if cache is not None else PageCache()
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    desc_elem = soup.select_one("#product_description ~ p")
+    # The same book is listed under several categories/paths: fetch it once
+    if book_url in cache.books:
+        cache.stats["fetches_avoided"] += 1
+        record = cache.books[book_url]
+    else:
+        record = fetch_record(book_url, parse_book_detail, cache)
+        cache.books[book_url] = record
 
-    return desc_elem.text.strip() if desc_elem else ""
+    return record["description"], record["availability_raw"], record["stock_count"]
 
+# Getting just description (Updated with the function above 'scrape_book_detail')
+def scrape_book_description(book_url: str, cache: PageCache | None = None) -> str:
+    """Scrape the book description from detail page."""
+    description, _, _ = scrape_book_detail(book_url, cache)
+    return description